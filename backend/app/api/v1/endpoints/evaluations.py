@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
 import re
 import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, TypeVar
 
 import fitz
-from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi import APIRouter, File, HTTPException, Request, UploadFile
 from pydantic import ValidationError
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib decoder.
+    orjson = None
+
 from app.api.v1.schemas.job import StructuredJobDescription
 from app.api.v1.schemas.resume import StructuredResume
 from app.services.ai.extractor import extract_structured_job_with_meta, extract_structured_resume_with_meta
@@ -20,14 +32,25 @@ from app.services.orchestrator import run_evaluation
 router = APIRouter(tags=["evaluations"])
 
 _MAX_FILE_BYTES = 5 * 1024 * 1024
+_READ_CHUNK_BYTES = 64 * 1024
+_MAX_SCAN_CHARS = 200_000
+_MAX_YEARS_MATCHES = 32
+# Ligatures expand to their letters and whitespace is normalized later anyway, so those
+# preservation flags are dropped. Clipping to the visible page stays, and so does CID
+# passthrough: without it, glyphs lacking a Unicode mapping come out as U+FFFD.
+_TEXT_FLAGS = fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_CID_FOR_UNKNOWN_UNICODE
 _logger = logging.getLogger(__name__)
-_ws_multi_re = re.compile(r"[ \t\u00a0]+")
-_nl_multi_re = re.compile(r"(?:\r?\n){3,}")
+_ws_trans = str.maketrans({"\t": " ", "\u00a0": " "})
+_ws_multi_re = re.compile(r" {2,}")
+_nl_multi_re = re.compile(r"\n{3,}")
+_years_re = re.compile(r"(\d+(?:\.\d+)?)\+?\s+years")
 _page_num_re = re.compile(r"^\s*(page\s*)?\d+\s*(/|\sof\s)\s*\d+\s*$", flags=re.IGNORECASE)
+_T = TypeVar("_T")
 
 
 @router.post("/evaluations/run")
 async def run_evaluation_from_pdfs(
+    request: Request,
     resume_file: UploadFile = File(...),
     job_file: UploadFile = File(...),
 ) -> dict[str, Any]:
@@ -37,51 +60,57 @@ async def run_evaluation_from_pdfs(
 
     try:
         pdf_started = time.perf_counter()
-        resume_text = _extract_pdf_text(resume_bytes)
-        job_text = _extract_pdf_text(job_bytes)
+        resume_text, job_text = await _extract_pdf_texts(request, resume_bytes, job_bytes)
         pdf_ms = int((time.perf_counter() - pdf_started) * 1000)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"PDF extraction failure: {e}") from None
 
+    # Keyword heuristics only look at the head of each document; skill and domain signal
+    # sits in the first pages, and this bounds the scan cost for book-length uploads.
+    resume_scan = resume_text[:_MAX_SCAN_CHARS]
+    job_scan = job_text[:_MAX_SCAN_CHARS]
+    resume_folded = resume_scan.casefold()
+    job_folded = job_scan.casefold()
+
     resume_fallback_used = False
     job_fallback_used = False
     resume_meta: dict[str, Any] = {}
     job_meta: dict[str, Any] = {}
 
-    try:
-        resume_extract_started = time.perf_counter()
-        resume_structured, resume_meta = extract_structured_resume_with_meta(resume_text)
-        resume_extract_ms = int((time.perf_counter() - resume_extract_started) * 1000)
-    except Exception as e:
+    # Both extractions are network-bound LLM calls; run them side by side and
+    # fall back to the heuristics per document if either one fails.
+    resume_outcome, job_outcome = await asyncio.gather(
+        asyncio.to_thread(_timed, extract_structured_resume_with_meta, resume_text),
+        asyncio.to_thread(_timed, extract_structured_job_with_meta, job_text),
+        return_exceptions=True,
+    )
+
+    if isinstance(resume_outcome, Exception):
         resume_fallback_used = True
-        resume_meta = {"error": str(e)}
+        resume_meta = {"error": str(resume_outcome)}
         try:
-            resume_extract_started = time.perf_counter()
-            resume_structured = _heuristic_extract_resume(resume_text)
-            resume_extract_ms = int((time.perf_counter() - resume_extract_started) * 1000)
+            resume_structured, resume_extract_ms = _timed(_heuristic_extract_resume, resume_scan, resume_folded)
         except Exception as e2:
             raise HTTPException(status_code=400, detail=f"Resume extraction failed: {e2}") from None
+    else:
+        (resume_structured, resume_meta), resume_extract_ms = resume_outcome
 
-    try:
-        job_extract_started = time.perf_counter()
-        job_structured, job_meta = extract_structured_job_with_meta(job_text)
-        job_extract_ms = int((time.perf_counter() - job_extract_started) * 1000)
-    except Exception as e:
+    if isinstance(job_outcome, Exception):
         job_fallback_used = True
-        job_meta = {"error": str(e)}
+        job_meta = {"error": str(job_outcome)}
         try:
-            job_extract_started = time.perf_counter()
-            job_structured = _heuristic_extract_job(job_text)
-            job_extract_ms = int((time.perf_counter() - job_extract_started) * 1000)
+            job_structured, job_extract_ms = _timed(_heuristic_extract_job, job_scan, job_folded)
         except Exception as e2:
             raise HTTPException(status_code=400, detail=f"Job extraction failed: {e2}") from None
+    else:
+        (job_structured, job_meta), job_extract_ms = job_outcome
 
     try:
-        inferred_job_domain = job_structured.domain or _infer_domain(job_text)
+        inferred_job_domain = job_structured.domain or _infer_domain(job_folded)
         if inferred_job_domain and inferred_job_domain != job_structured.domain:
             job_structured = job_structured.model_copy(update={"domain": inferred_job_domain})
 
-        inferred_resume_domain = _infer_domain(resume_text)
+        inferred_resume_domain = _infer_domain(resume_folded)
         if inferred_resume_domain:
             existing = {d.casefold() for d in resume_structured.domains}
             if inferred_resume_domain.casefold() not in existing:
@@ -139,11 +168,44 @@ async def _read_pdf_bytes(file: UploadFile, field_name: str) -> bytes:
     if content_type and content_type not in {"application/pdf", "application/x-pdf"}:
         raise HTTPException(status_code=400, detail=f"Invalid file type for {field_name}: only PDF allowed")
 
-    data = await file.read()
-    if len(data) > _MAX_FILE_BYTES:
-        raise HTTPException(status_code=400, detail=f"{field_name} exceeds 5MB limit")
+    buf = bytearray()
+    while chunk := await file.read(_READ_CHUNK_BYTES):
+        buf.extend(chunk)
+        if len(buf) > _MAX_FILE_BYTES:
+            raise HTTPException(status_code=400, detail=f"{field_name} exceeds 5MB limit")
+
+    return bytes(buf)
 
-    return data
+
+def _timed(fn: Callable[..., _T], *args: Any) -> tuple[_T, int]:
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, int((time.perf_counter() - started) * 1000)
+
+
+async def _extract_pdf_texts(request: Request, resume_bytes: bytes, job_bytes: bytes) -> tuple[str, str]:
+    process_pool = getattr(request.app.state, "process_pool", None)
+    try:
+        return await _gather_pdf_texts(process_pool, resume_bytes, job_bytes)
+    except BrokenProcessPool:
+        # A crashed worker breaks the executor for good. Swap in a fresh one (unless a
+        # concurrent request already has) and retry once; a second crash surfaces as a 500.
+        _logger.warning("pdf_process_pool_broken replacing=true")
+        if request.app.state.process_pool is process_pool:
+            request.app.state.process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+            process_pool.shutdown(wait=False, cancel_futures=True)
+    return await _gather_pdf_texts(request.app.state.process_pool, resume_bytes, job_bytes)
+
+
+async def _gather_pdf_texts(
+    process_pool: ProcessPoolExecutor | None, resume_bytes: bytes, job_bytes: bytes
+) -> tuple[str, str]:
+    loop = asyncio.get_running_loop()
+    resume_text, job_text = await asyncio.gather(
+        loop.run_in_executor(process_pool, _extract_pdf_text, resume_bytes),
+        loop.run_in_executor(process_pool, _extract_pdf_text, job_bytes),
+    )
+    return resume_text, job_text
 
 
 def _extract_pdf_text(data: bytes) -> str:
@@ -151,21 +213,15 @@ def _extract_pdf_text(data: bytes) -> str:
     try:
         pages: list[list[str]] = []
         for page in doc:
-            raw = page.get_text("text") or ""
-            lines = [ln.strip() for ln in raw.splitlines()]
-            lines = [ln for ln in lines if ln]
-            pages.append(lines)
-
-        header_counts: dict[str, int] = {}
-        footer_counts: dict[str, int] = {}
-        for lines in pages:
-            if not lines:
-                continue
-            header_counts[lines[0]] = header_counts.get(lines[0], 0) + 1
-            footer_counts[lines[-1]] = footer_counts.get(lines[-1], 0) + 1
+            textpage = page.get_textpage(flags=_TEXT_FLAGS)
+            raw = textpage.extractText() or ""
+            textpage = None
+            pages.append([stripped for ln in raw.splitlines() if (stripped := ln.strip())])
 
-        header_candidate = max(header_counts, key=header_counts.get) if header_counts else None
-        footer_candidate = max(footer_counts, key=footer_counts.get) if footer_counts else None
+        header_counts = Counter(lines[0] for lines in pages if lines)
+        footer_counts = Counter(lines[-1] for lines in pages if lines)
+        header_candidate, header_n = header_counts.most_common(1)[0] if header_counts else (None, 0)
+        footer_candidate, footer_n = footer_counts.most_common(1)[0] if footer_counts else (None, 0)
 
         cleaned_pages: list[str] = []
         for lines in pages:
@@ -173,20 +229,10 @@ def _extract_pdf_text(data: bytes) -> str:
                 cleaned_pages.append("")
                 continue
 
-            if (
-                header_candidate
-                and header_counts.get(header_candidate, 0) >= 2
-                and lines
-                and lines[0] == header_candidate
-            ):
+            if header_n >= 2 and lines[0] == header_candidate:
                 lines = lines[1:]
 
-            if (
-                footer_candidate
-                and footer_counts.get(footer_candidate, 0) >= 2
-                and lines
-                and lines[-1] == footer_candidate
-            ):
+            if footer_n >= 2 and lines and lines[-1] == footer_candidate:
                 lines = lines[:-1]
 
             if lines and _page_num_re.match(lines[-1]):
@@ -199,60 +245,86 @@ def _extract_pdf_text(data: bytes) -> str:
         doc.close()
 
 
+@lru_cache(maxsize=1)
 def _load_rubric_v1() -> dict[str, Any]:
     rubric_path = Path(__file__).resolve().parents[3] / "services" / "scoring" / "rubrics" / "v1.json"
     try:
-        return json.loads(rubric_path.read_text(encoding="utf-8"))
+        raw = rubric_path.read_bytes()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load rubric: {e}") from None
 
 
 def _normalize_whitespace(text: str) -> str:
+    # Normalize line endings first so the newline collapse is a plain character-class run
+    # with no alternation to backtrack through.
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = text.translate(_ws_trans)
     text = _ws_multi_re.sub(" ", text)
     text = _nl_multi_re.sub("\n\n", text)
     return text.strip()
 
 
-_KNOWN_SKILLS: tuple[str, ...] = (
-    "python",
-    "java",
-    "javascript",
-    "typescript",
-    "react",
-    "nextjs",
-    "nodejs",
-    "fastapi",
-    "django",
-    "flask",
-    "sql",
-    "postgresql",
-    "mysql",
-    "mongodb",
-    "redis",
-    "aws",
-    "azure",
-    "gcp",
-    "docker",
-    "kubernetes",
-    "git",
-    "linux",
+# Alias -> canonical display form. Aliases of one skill sit next to each other so the scan
+# emits skills in table order.
+_SKILL_ALIASES: dict[str, str] = {
+    "python": "Python",
+    "java": "Java",
+    "javascript": "Javascript",
+    "typescript": "Typescript",
+    "react": "React",
+    "next.js": "Next.js",
+    "nextjs": "Next.js",
+    "node.js": "Node.js",
+    "nodejs": "Node.js",
+    "fastapi": "Fastapi",
+    "django": "Django",
+    "flask": "Flask",
+    "sql": "SQL",
+    "postgres": "PostgreSQL",
+    "postgresql": "PostgreSQL",
+    "mysql": "Mysql",
+    "mongodb": "Mongodb",
+    "redis": "Redis",
+    "aws": "AWS",
+    "amazon web services": "AWS",
+    "azure": "Azure",
+    "gcp": "GCP",
+    "google cloud": "GCP",
+    "docker": "Docker",
+    "kubernetes": "Kubernetes",
+    "git": "Git",
+    "linux": "Linux",
+}
+
+
+_DOMAIN_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "fintech": ("fintech", "payment", "payments", "bank", "banking", "credit", "lending", "wallet", "kyc", "aml"),
+    "healthcare": ("healthcare", "hospital", "clinical", "patient", "hipaa", "ehr", "emr"),
+    "ecommerce": ("ecommerce", "e-commerce", "shop", "checkout", "cart", "order", "retail", "marketplace", "shopify"),
+    "saas": ("saas", "b2b", "subscription", "multi-tenant", "tenant", "crm", "erp"),
+    "data": ("data", "analytics", "etl", "warehouse", "bigquery", "snowflake", "databricks", "pipeline"),
+    "ml_ai": ("machine learning", "ml", "llm", "nlp", "computer vision", "rag", "prompt"),
+}
+
+
+_EDUCATION_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "Bachelor": ("bachelor", "b.tech", "btech", "b.sc"),
+    "Master": ("master", "m.tech", "mtech", "m.sc"),
+    "PhD": ("phd", "doctorate"),
+}
+# Job-side requirement keywords, kept as they were: the resume table's b.sc/m.sc do not set
+# a job's required_education.
+_JOB_EDUCATION_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Master", ("master", "m.tech", "mtech")),
+    ("Bachelor", ("bachelor", "b.tech", "btech")),
 )
 
 
-def _infer_domain(text: str) -> str | None:
-    t = (text or "").casefold()
-    buckets: dict[str, tuple[str, ...]] = {
-        "fintech": ("fintech", "payment", "payments", "bank", "banking", "credit", "lending", "wallet", "kyc", "aml"),
-        "healthcare": ("healthcare", "hospital", "clinical", "patient", "hipaa", "ehr", "emr"),
-        "ecommerce": ("ecommerce", "e-commerce", "shop", "checkout", "cart", "order", "retail", "marketplace", "shopify"),
-        "saas": ("saas", "b2b", "subscription", "multi-tenant", "tenant", "crm", "erp"),
-        "data": ("data", "analytics", "etl", "warehouse", "bigquery", "snowflake", "databricks", "pipeline"),
-        "ml_ai": ("machine learning", "ml", "llm", "nlp", "computer vision", "rag", "prompt"),
-    }
-
+def _infer_domain(t: str) -> str | None:
     best = None
     best_score = 0
-    for domain, kws in buckets.items():
+    for domain, kws in _DOMAIN_KEYWORDS.items():
         score = 0
         for kw in kws:
             if kw in t:
@@ -263,41 +335,25 @@ def _infer_domain(text: str) -> str | None:
     return best if best_score > 0 else None
 
 
-def _scan_skills(text: str) -> list[str]:
-    t = (text or "").casefold()
-    skills: list[str] = []
-    for s in _KNOWN_SKILLS:
-        token = s
-        if token == "nextjs" and ("next.js" in t or "nextjs" in t):
-            skills.append("Next.js")
-            continue
-        if token == "nodejs" and ("node.js" in t or "nodejs" in t):
-            skills.append("Node.js")
-            continue
-        if token == "gcp" and ("gcp" in t or "google cloud" in t):
-            skills.append("GCP")
-            continue
-        if token == "aws" and ("aws" in t or "amazon web services" in t):
-            skills.append("AWS")
-            continue
-        if token == "postgresql" and ("postgres" in t or "postgresql" in t):
-            skills.append("PostgreSQL")
-            continue
-        if token in t:
-            skills.append(token.upper() if token in {"sql"} else token.title())
-    seen: set[str] = set()
-    out: list[str] = []
-    for s in skills:
-        key = s.casefold()
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(s)
-    return out
+def _scan_keywords(t: str) -> tuple[list[str], str | None, list[str]]:
+    """
+    Skills, best-matching domain and education levels for already casefolded text.
+
+    All three come out of one walk over the module-level keyword tables so callers that
+    need several signals do not casefold and rescan the document once per signal.
+    """
 
+    skills: dict[str, None] = {}
+    for alias, canonical in _SKILL_ALIASES.items():
+        if canonical not in skills and alias in t:
+            skills[canonical] = None
 
-def _heuristic_extract_resume(text: str) -> StructuredResume:
-    lines = [ln.strip() for ln in (text or "").splitlines() if ln.strip()]
+    education = [level for level, kws in _EDUCATION_KEYWORDS.items() if any(kw in t for kw in kws)]
+    return list(skills), _infer_domain(t), education
+
+
+def _heuristic_extract_resume(text: str, t: str) -> StructuredResume:
+    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
     name = None
     if lines:
         candidate = lines[0]
@@ -305,7 +361,7 @@ def _heuristic_extract_resume(text: str) -> StructuredResume:
             name = candidate
 
     years = 0.0
-    for m in re.finditer(r"(\d+(?:\.\d+)?)\+?\s+years", (text or ""), flags=re.IGNORECASE):
+    for m in islice(_years_re.finditer(t), _MAX_YEARS_MATCHES):
         try:
             years = max(years, float(m.group(1)))
         except ValueError:
@@ -313,18 +369,11 @@ def _heuristic_extract_resume(text: str) -> StructuredResume:
     if years > 50:
         years = 50.0
 
-    domain = _infer_domain(text)
-    skills = _scan_skills(text)
-    education: list[str] = []
-    t = (text or "").casefold()
-    if "bachelor" in t or "b.tech" in t or "btech" in t or "b.sc" in t:
-        education.append("Bachelor")
-    if "master" in t or "m.tech" in t or "mtech" in t or "m.sc" in t:
-        education.append("Master")
-    if "phd" in t or "doctorate" in t:
-        education.append("PhD")
-
-    return StructuredResume(
+    skills, domain, education = _scan_keywords(t)
+
+    # Every field below is already stripped, deduplicated and typed by construction, so the
+    # schema validators are skipped here; the LLM path still goes through full validation.
+    return StructuredResume.model_construct(
         full_name=name or "Candidate",
         total_years_experience=years,
         skills=skills,
@@ -335,35 +384,28 @@ def _heuristic_extract_resume(text: str) -> StructuredResume:
     )
 
 
-def _heuristic_extract_job(text: str) -> StructuredJobDescription:
-    t = (text or "").casefold()
-    skills = _scan_skills(text)
+def _heuristic_extract_job(text: str, t: str) -> StructuredJobDescription:
+    skills, domain, _ = _scan_keywords(t)
 
     min_years = 0.0
-    for m in re.finditer(r"(\d+(?:\.\d+)?)\+?\s+years", (text or ""), flags=re.IGNORECASE):
-        start = max(0, m.start() - 40)
-        window = (text or "")[start : m.end() + 40].casefold()
-        if "experience" in window or "years" in window:
-            try:
-                min_years = max(min_years, float(m.group(1)))
-            except ValueError:
-                continue
+    for m in islice(_years_re.finditer(t), _MAX_YEARS_MATCHES):
+        try:
+            min_years = max(min_years, float(m.group(1)))
+        except ValueError:
+            continue
     if min_years > 40:
         min_years = 40.0
 
-    required_education = None
-    if "bachelor" in t or "b.tech" in t or "btech" in t:
-        required_education = "Bachelor"
-    if "master" in t or "m.tech" in t or "mtech" in t:
-        required_education = "Master"
-
-    domain = _infer_domain(text)
+    # Highest level mentioned wins.
+    required_education = next(
+        (level for level, kws in _JOB_EDUCATION_KEYWORDS if any(kw in t for kw in kws)), None
+    )
 
     required_skills = skills if skills else []
     if not required_skills:
         raise ValueError("Unable to infer required_skills from job description text")
 
-    return StructuredJobDescription(
+    return StructuredJobDescription.model_construct(
         domain=domain,
         required_skills=required_skills,
         preferred_skills=[],
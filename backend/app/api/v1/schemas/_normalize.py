@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+
+def normalize_token(value: str) -> str:
+    return " ".join(value.split())
+
+
+def validate_str_list(values: list[str], field_name: str) -> list[str]:
+    by_key: dict[str, str] = {}
+
+    for raw in values:
+        token = normalize_token(raw)
+        if not token:
+            raise ValueError(f"{field_name} must not contain empty items")
+        by_key.setdefault(token.casefold(), token)
+
+    return list(by_key.values())
@@ -1,34 +1,10 @@
 from __future__ import annotations
 
-import re
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field, StrictStr, field_validator
 
-
-_ws_re = re.compile(r"\s+")
-
-
-def _normalize_token(value: str) -> str:
-    return _ws_re.sub(" ", value.strip())
-
-
-def _validate_str_list(values: list[str], field_name: str) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-
-    for raw in values:
-        token = _normalize_token(raw)
-        if not token:
-            raise ValueError(f"{field_name} must not contain empty items")
-
-        key = token.casefold()
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(token)
-
-    return out
+from app.api.v1.schemas._normalize import normalize_token, validate_str_list
 
 
 class StructuredJobDescription(BaseModel):
@@ -60,14 +36,14 @@ class StructuredJobDescription(BaseModel):
     @field_validator("required_skills", "preferred_skills")
     @classmethod
     def _validate_skill_lists(cls, v: list[StrictStr], info):
-        return _validate_str_list(list(v), info.field_name)
+        return validate_str_list(list(v), info.field_name)
 
     @field_validator("required_education", "domain")
     @classmethod
     def _validate_optionals(cls, v: Optional[StrictStr]):
         if v is None:
             return None
-        token = _normalize_token(str(v))
+        token = normalize_token(str(v))
         if not token:
             raise ValueError("must be null or a non-empty string")
         return token
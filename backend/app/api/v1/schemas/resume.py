@@ -1,33 +1,8 @@
 from __future__ import annotations
 
-import re
-
 from pydantic import BaseModel, ConfigDict, Field, StrictStr, field_validator
 
-
-_ws_re = re.compile(r"\s+")
-
-
-def _normalize_token(value: str) -> str:
-    return _ws_re.sub(" ", value.strip())
-
-
-def _validate_str_list(values: list[str], field_name: str) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-
-    for raw in values:
-        token = _normalize_token(raw)
-        if not token:
-            raise ValueError(f"{field_name} must not contain empty items")
-
-        key = token.casefold()
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(token)
-
-    return out
+from app.api.v1.schemas._normalize import validate_str_list
 
 
 class StructuredResume(BaseModel):
@@ -67,4 +42,4 @@ class StructuredResume(BaseModel):
     @field_validator("skills", "companies", "education", "projects", "domains")
     @classmethod
     def _validate_lists(cls, v: list[StrictStr], info):
-        return _validate_str_list(list(v), info.field_name)
+        return validate_str_list(list(v), info.field_name)
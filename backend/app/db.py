@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.config import settings
@@ -10,9 +11,20 @@ class Base(DeclarativeBase):
     pass
 
 
+# The session timezone option is a libpq argument; other drivers reject it.
+_connect_args = (
+    {"options": "-c timezone=utc"} if make_url(settings.database_url).get_backend_name() == "postgresql" else {}
+)
+
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    # LIFO keeps a small set of connections hot and lets idle ones age out via pool_recycle.
+    pool_use_lifo=True,
+    pool_recycle=1800,
+    connect_args=_connect_args,
 )
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
@@ -6,6 +6,11 @@ import logging
 import logging.config
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder.
+    orjson = None
+
 
 request_id_ctx: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "request_id", default=None
@@ -36,6 +41,12 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             payload["exc"] = self.formatException(record.exc_info)
 
+        if orjson is not None:
+            try:
+                return orjson.dumps(payload).decode("utf-8")
+            except TypeError:
+                # e.g. lone surrogates in the message, which only the stdlib encoder accepts.
+                pass
         return json.dumps(payload, ensure_ascii=False)
 
 
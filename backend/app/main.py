@@ -3,6 +3,8 @@ from __future__ import annotations
 import logging
 import os
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
@@ -13,15 +15,27 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.api.v1.router import router as v1_router
 from app.config import settings
 from app.logging import configure_logging, request_id_ctx
+from app.services.ai.extractor import close_http_connections
 
 
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # CPU-bound PDF parsing runs here so concurrent uploads are not serialized on the GIL.
+    app.state.process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    try:
+        yield
+    finally:
+        app.state.process_pool.shutdown(wait=False, cancel_futures=True)
+        close_http_connections()
+
+
 def create_app() -> FastAPI:
     configure_logging(settings.log_level)
 
-    app = FastAPI(title=settings.app_name)
+    app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
     if not os.getenv("GROQ_API_KEY"):
         raise RuntimeError("GROQ_API_KEY is required")
@@ -1,22 +1,105 @@
 from __future__ import annotations
 
+import base64
+import contextvars
+import hashlib
+import http.client
+import io
 import json
 import logging
 import os
+import queue
+import random
+import re
+import threading
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
-from typing import Any, Mapping, TypeVar
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Callable, Mapping, NamedTuple, TypeVar
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec.
+    orjson = None
 
 from app.api.v1.schemas.job import StructuredJobDescription
 from app.api.v1.schemas.resume import StructuredResume
 
 
 _T = TypeVar("_T", StructuredResume, StructuredJobDescription)
+_R = TypeVar("_R")
 _logger = logging.getLogger(__name__)
 
+_MAX_FAILURE_DETAIL = 200
+
+
+class _Fail(NamedTuple):
+    model: str
+    stage: str
+    detail: str
+
+
+_GROQ_HOST = "api.groq.com"
+_GROQ_PATH = "/openai/v1/chat/completions"
+_GROQ_ENDPOINT = f"https://{_GROQ_HOST}{_GROQ_PATH}"
+
+# Idle keep-alive connections to Groq. Extraction and summary calls reuse them instead of
+# paying a TCP + TLS handshake per request; LIFO keeps the most recently used (least
+# likely to have been closed by the server) connection on top.
+# Bounded and non-blocking: a burst may open more connections, but only this many are kept.
+_MAX_IDLE_CONNECTIONS = 32
+_idle_connections: queue.LifoQueue[http.client.HTTPSConnection] = queue.LifoQueue(maxsize=_MAX_IDLE_CONNECTIONS)
+_CONNECT_TIMEOUT_S = 5.0
+# Errors that mean a reused connection was already closed by the server (RemoteDisconnected
+# is a ConnectionResetError). Timeouts are deliberately not in this list.
+_STALE_CONNECTION_ERRORS = (ConnectionResetError, BrokenPipeError)
+
+# Models that rejected response_format=json_object; they are sent plain requests from then on.
+_NO_JSON_MODE: set[str] = set()
+
+# Completions are capped at 1200 tokens, so anything near this size is a broken response.
+_MAX_RESPONSE_BYTES = 512 * 1024
+_RESPONSE_READ_CHUNK = 64 * 1024
+
+# Completions are requested at temperature 0, so an identical (model, messages) request
+# returns the same content; re-uploads and repeated evaluations are served from here.
+_RESPONSE_CACHE_MAX_ENTRIES = 1024
+_RESPONSE_CACHE_TTL_S = 7 * 24 * 3600
+_response_cache: OrderedDict[str, tuple[str, float]] = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+_API_KEY_TTL_S = 30.0
+_api_key_value: str | None = None
+_api_key_expires = 0.0
+
+_WS_RE = re.compile(r"\s+")
+_HSPACE_RUN_RE = re.compile(r"[^\S\n]+")
+_NL_RUN_RE = re.compile(r" ?\n\s*")
+_FENCE_RE = re.compile(r"^```[a-zA-Z]*\n|\n```\s*$", re.MULTILINE)
+
+_SUMMARY_BUDGET_S = 8
+
+_SUMMARY_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {"recommendation": {"type": "string"}},
+    "required": ["recommendation"],
+}
+_SUMMARY_SYSTEM_PROMPT = (
+    "You write concise hiring recommendations.\n"
+    "Return a single JSON object only.\n"
+    "Do not add extra keys.\n"
+    f"JSON Schema:\n{json.dumps(_SUMMARY_SCHEMA, ensure_ascii=False)}\n"
+)
+
 
 def extract_structured_resume(raw_text: str) -> StructuredResume:
     return extract_structured_resume_with_meta(raw_text)[0]
@@ -46,68 +129,139 @@ def _extract_with_meta(raw_text: str, model_cls: type[_T], extraction_target: st
     if not isinstance(raw_text, str) or not raw_text.strip():
         raise ValueError("raw_text must be a non-empty string")
 
-    raw_text = raw_text[:12000]
+    if not _api_key_cached():
+        raise ValueError("GROQ_API_KEY is required")
 
-    schema = model_cls.model_json_schema()
-    system_prompt = _system_prompt(schema=schema, extraction_target=extraction_target)
-    json_retry_prompt = _json_retry_prompt(schema=schema, extraction_target=extraction_target)
+    raw_text = _truncate_by_tokens_approx(raw_text)
+
+    system_prompt, json_retry_prompt, schema_json = _prompts_for(model_cls, extraction_target)
+
+    failures: list[_Fail] = []
+    models = _get_groq_models()
+    hedge_k = _get_hedge_k()
+
+    def attempt(model: str) -> tuple[_T, dict[str, Any]] | None:
+        return _extract_one(
+            model=model,
+            raw_text=raw_text,
+            model_cls=model_cls,
+            extraction_target=extraction_target,
+            schema_json=schema_json,
+            system_prompt=system_prompt,
+            json_retry_prompt=json_retry_prompt,
+            failures=failures,
+        )
+
+    # Hedge the first models: whichever validates first wins, so a slow or failing primary
+    # costs max(latencies) instead of their sum. Remaining models are tried in order.
+    result = _first_success(models[:hedge_k], attempt)
+    if result is not None:
+        return result
+    for model in models[hedge_k:]:
+        result = attempt(model)
+        if result is not None:
+            return result
 
-    failures: list[str] = []
+    if failures:
+        unique = list(dict.fromkeys(failures))
+        detail = " | ".join(f"{f.model}:{f.stage}:{f.detail}" for f in unique[:6])
+        if len(unique) > 6:
+            detail = f"{detail} | (+{len(unique) - 6} more)"
+        raise ValueError(f"All Groq models failed: {detail}")
 
-    for model in _get_groq_models():
-        meta: dict[str, Any] = {
-            "target": extraction_target,
-            "model_used": model,
-            "attempts": 0,
-            "latency_ms": [],
-            "stages": [],
-        }
-        _logger.info("model_attempt model=%s target=%s", model, extraction_target)
+    raise ValueError("All Groq models failed")
+
+
+def _extract_one(
+    *,
+    model: str,
+    raw_text: str,
+    model_cls: type[_T],
+    extraction_target: str,
+    schema_json: str,
+    system_prompt: str,
+    json_retry_prompt: str,
+    failures: list[_Fail],
+) -> tuple[_T, dict[str, Any]] | None:
+    meta: dict[str, Any] = {
+        "target": extraction_target,
+        "model_used": model,
+        "attempts": 0,
+        "latency_ms": [],
+        "stages": [],
+    }
+    _logger.info("model_attempt model=%s target=%s", model, extraction_target)
+    try:
+        content, latency_ms = _chat_completion(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": raw_text},
+            ],
+            model=model,
+        )
+        meta["attempts"] = int(meta["attempts"]) + 1
+        meta["latency_ms"].append(latency_ms)
+    except ValueError as e:
+        _logger.warning("model_failure model=%s target=%s stage=http detail=%s", model, extraction_target, e)
+        failures.append(_Fail(model, "http", str(e)[:_MAX_FAILURE_DETAIL]))
+        return None
+
+    try:
+        parsed = _parse_json_object(content)
+        meta["stages"].append("json_parse")
+    except ValueError as e:
+        _logger.warning("model_failure model=%s target=%s stage=json_parse detail=%s", model, extraction_target, e)
+        failures.append(_Fail(model, "json_parse", str(e)[:_MAX_FAILURE_DETAIL]))
         try:
-            content, latency_ms = _chat_completion(
+            content_retry, latency_ms_retry = _chat_completion(
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": json_retry_prompt},
                     {"role": "user", "content": raw_text},
                 ],
                 model=model,
             )
+            parsed = _parse_json_object(content_retry)
             meta["attempts"] = int(meta["attempts"]) + 1
-            meta["latency_ms"].append(latency_ms)
-        except ValueError as e:
-            _logger.warning("model_failure model=%s target=%s stage=http detail=%s", model, extraction_target, e)
-            failures.append(f"{model}:http:{e}")
-            continue
-
-        try:
-            parsed = _parse_json_object(content)
-            meta["stages"].append("json_parse")
-        except ValueError as e:
-            _logger.warning("model_failure model=%s target=%s stage=json_parse detail=%s", model, extraction_target, e)
-            failures.append(f"{model}:json_parse:{e}")
-            try:
-                content_retry, latency_ms_retry = _chat_completion(
-                    messages=[
-                        {"role": "system", "content": json_retry_prompt},
-                        {"role": "user", "content": raw_text},
-                    ],
-                    model=model,
-                )
-                parsed = _parse_json_object(content_retry)
-                meta["attempts"] = int(meta["attempts"]) + 1
-                meta["latency_ms"].append(latency_ms_retry)
-                meta["stages"].append("json_parse_retry")
-            except ValueError as e2:
-                _logger.warning(
-                    "model_failure model=%s target=%s stage=json_parse_retry detail=%s",
-                    model,
-                    extraction_target,
-                    e2,
-                )
-                failures.append(f"{model}:json_parse_retry:{e2}")
-                continue
+            meta["latency_ms"].append(latency_ms_retry)
+            meta["stages"].append("json_parse_retry")
+        except ValueError as e2:
+            _logger.warning(
+                "model_failure model=%s target=%s stage=json_parse_retry detail=%s",
+                model,
+                extraction_target,
+                e2,
+            )
+            failures.append(_Fail(model, "json_parse_retry", str(e2)[:_MAX_FAILURE_DETAIL]))
+            return None
 
+    try:
+        validated = model_cls.model_validate(parsed)
+        _logger.info(
+            "model_success model=%s target=%s attempts=%s latency_ms=%s",
+            model,
+            extraction_target,
+            meta["attempts"],
+            sum(meta["latency_ms"]) if meta["latency_ms"] else 0,
+        )
+        meta["validated"] = True
+        return validated, meta
+    except ValidationError as e:
+        _logger.warning("model_failure model=%s target=%s stage=validation detail=%s", model, extraction_target, e)
+        failures.append(_Fail(model, "validation", str(e)[:_MAX_FAILURE_DETAIL]))
+        correction_prompt = _correction_prompt(schema_json=schema_json, extraction_target=extraction_target, error=str(e))
         try:
-            validated = model_cls.model_validate(parsed)
+            content_retry, latency_ms_retry = _chat_completion(
+                messages=[
+                    {"role": "system", "content": correction_prompt},
+                    {"role": "user", "content": raw_text},
+                ],
+                model=model,
+            )
+            parsed_retry = _parse_json_object(content_retry)
+            validated_retry = model_cls.model_validate(parsed_retry)
+            meta["attempts"] = int(meta["attempts"]) + 1
+            meta["latency_ms"].append(latency_ms_retry)
+            meta["stages"].append("validation_retry")
             _logger.info(
                 "model_success model=%s target=%s attempts=%s latency_ms=%s",
                 model,
@@ -116,57 +270,64 @@ def _extract_with_meta(raw_text: str, model_cls: type[_T], extraction_target: st
                 sum(meta["latency_ms"]) if meta["latency_ms"] else 0,
             )
             meta["validated"] = True
-            return validated, meta
-        except ValidationError as e:
-            _logger.warning("model_failure model=%s target=%s stage=validation detail=%s", model, extraction_target, e)
-            failures.append(f"{model}:validation:{e}")
-            correction_prompt = _correction_prompt(schema=schema, extraction_target=extraction_target, error=str(e))
-            try:
-                content_retry, latency_ms_retry = _chat_completion(
-                    messages=[
-                        {"role": "system", "content": correction_prompt},
-                        {"role": "user", "content": raw_text},
-                    ],
-                    model=model,
-                )
-                parsed_retry = _parse_json_object(content_retry)
-                validated_retry = model_cls.model_validate(parsed_retry)
-                meta["attempts"] = int(meta["attempts"]) + 1
-                meta["latency_ms"].append(latency_ms_retry)
-                meta["stages"].append("validation_retry")
-                _logger.info(
-                    "model_success model=%s target=%s attempts=%s latency_ms=%s",
-                    model,
-                    extraction_target,
-                    meta["attempts"],
-                    sum(meta["latency_ms"]) if meta["latency_ms"] else 0,
-                )
-                meta["validated"] = True
-                return validated_retry, meta
-            except (ValueError, ValidationError) as e2:
-                _logger.warning(
-                    "model_failure model=%s target=%s stage=validation_retry detail=%s",
-                    model,
-                    extraction_target,
-                    e2,
-                )
-                failures.append(f"{model}:validation_retry:{e2}")
-                continue
+            return validated_retry, meta
+        except (ValueError, ValidationError) as e2:
+            _logger.warning(
+                "model_failure model=%s target=%s stage=validation_retry detail=%s",
+                model,
+                extraction_target,
+                e2,
+            )
+            failures.append(_Fail(model, "validation_retry", str(e2)[:_MAX_FAILURE_DETAIL]))
+            return None
 
-    if failures:
-        unique: list[str] = []
-        seen: set[str] = set()
-        for item in failures:
-            if item in seen:
-                continue
-            seen.add(item)
-            unique.append(item)
-        detail = " | ".join(unique[:6])
-        if len(unique) > 6:
-            detail = f"{detail} | (+{len(unique) - 6} more)"
-        raise ValueError(f"All Groq models failed: {detail}")
 
-    raise ValueError("All Groq models failed")
+def _truncate_by_tokens_approx(text: str, max_chars: int = 12000) -> str:
+    """
+    Collapse whitespace runs, then cap the prompt text at `max_chars`.
+
+    - 12k characters is roughly 3k tokens of English text.
+    - Line breaks are kept (one per run) since they carry the resume/JD layout.
+    """
+
+    text = _NL_RUN_RE.sub("\n", _HSPACE_RUN_RE.sub(" ", text)).strip()
+    return text if len(text) <= max_chars else text[:max_chars]
+
+
+def _first_success(
+    models: list[str],
+    attempt: Callable[[str], _R | None],
+    *,
+    timeout_s: float | None = None,
+) -> _R | None:
+    """
+    Run `attempt` for each model concurrently and return the first non-None result.
+
+    Ties are broken by model order. Attempts still in flight when a winner is found (or
+    when `timeout_s` runs out, which returns None) are abandoned; their threads finish in
+    the background and their results are discarded.
+    """
+
+    if len(models) <= 1 and timeout_s is None:
+        return attempt(models[0]) if models else None
+
+    deadline = None if timeout_s is None else time.monotonic() + timeout_s
+    executor = ThreadPoolExecutor(max_workers=max(1, len(models)), thread_name_prefix="groq-hedge")
+    try:
+        futures = {executor.submit(contextvars.copy_context().run, attempt, m): i for i, m in enumerate(models)}
+        pending = set(futures)
+        while pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            if not done:
+                return None
+            for fut in sorted(done, key=futures.__getitem__):
+                result = fut.result()
+                if result is not None:
+                    return result
+        return None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def _get_groq_models() -> list[str]:
@@ -182,13 +343,38 @@ def _get_groq_models() -> list[str]:
     ]
 
 
+def _get_hedge_k() -> int:
+    raw = os.getenv("GROQ_HEDGE_K", "")
+    try:
+        value = int(raw) if raw.strip() else 2
+    except ValueError:
+        value = 2
+    return value if value >= 1 else 1
+
+
+def _api_key_cached() -> str | None:
+    """GROQ_API_KEY, re-read from the environment at most every _API_KEY_TTL_S seconds."""
+
+    global _api_key_value, _api_key_expires
+    now = time.monotonic()
+    if now >= _api_key_expires:
+        _api_key_value = os.getenv("GROQ_API_KEY") or None
+        _api_key_expires = now + _API_KEY_TTL_S
+    return _api_key_value
+
+
+def _reset_api_key_cache() -> None:
+    """Forget the cached GROQ_API_KEY so the next lookup reads the environment."""
+    global _api_key_value, _api_key_expires
+    _api_key_value = None
+    _api_key_expires = 0.0
+
+
 def _chat_completion(messages: list[dict[str, str]], model: str, *, timeout_s: int = 45) -> tuple[str, int]:
-    api_key = os.getenv("GROQ_API_KEY")
+    api_key = _api_key_cached()
     if not api_key:
         raise ValueError("GROQ_API_KEY is required")
 
-    endpoint = "https://api.groq.com/openai/v1/chat/completions"
-
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
@@ -201,30 +387,33 @@ def _chat_completion(messages: list[dict[str, str]], model: str, *, timeout_s: i
         "temperature": 0,
         "max_tokens": 1200,
         "messages": messages,
-        "response_format": {"type": "json_object"},
     }
+    if model not in _NO_JSON_MODE:
+        payload["response_format"] = {"type": "json_object"}
 
-    req = urllib.request.Request(
-        endpoint,
-        data=json.dumps(payload).encode("utf-8"),
-        headers=headers,
-        method="POST",
-    )
+    cache_key = _response_cache_key(model=model, messages=messages, response_format=payload.get("response_format"))
+    cached = _response_cache_get(cache_key)
+    if cached is not None:
+        return cached, 0
 
     try:
-        body, latency_ms = _do_request_with_retry(req, timeout_s=timeout_s)
+        body, latency_ms = _do_request_with_retry(
+            _json_bytes(payload),
+            headers,
+            timeout_s=timeout_s,
+        )
     except urllib.error.HTTPError as e:
         detail = e.read().decode("utf-8", errors="replace")
         if e.code == 400 and ("response_format" in detail or "json_object" in detail or "response format" in detail):
+            # Remember the model so later calls skip the rejected round-trip.
+            _NO_JSON_MODE.add(model)
             payload.pop("response_format", None)
-            req2 = urllib.request.Request(
-                endpoint,
-                data=json.dumps(payload).encode("utf-8"),
-                headers=headers,
-                method="POST",
-            )
             try:
-                body, latency_ms = _do_request_with_retry(req2, timeout_s=timeout_s)
+                body, latency_ms = _do_request_with_retry(
+                    _json_bytes(payload),
+                    headers,
+                    timeout_s=timeout_s,
+                )
             except urllib.error.HTTPError as e2:
                 detail2 = e2.read().decode("utf-8", errors="replace")
                 raise ValueError(f"HTTP {e2.code}: {detail2}") from None
@@ -236,7 +425,7 @@ def _chat_completion(messages: list[dict[str, str]], model: str, *, timeout_s: i
         raise ValueError(f"connection error: {e.reason}") from None
 
     try:
-        data = json.loads(body)
+        data = _json_loads(body)
         content = data["choices"][0]["message"]["content"]
     except Exception as e:
         raise ValueError(f"invalid response format: {e}") from None
@@ -244,21 +433,47 @@ def _chat_completion(messages: list[dict[str, str]], model: str, *, timeout_s: i
     if not isinstance(content, str) or not content.strip():
         raise ValueError("empty content")
 
+    _response_cache_put(cache_key, content)
     return content, latency_ms
 
 
+def _response_cache_key(model: str, messages: list[dict[str, str]], response_format: Any) -> str:
+    raw = json.dumps({"m": model, "msgs": messages, "rf": response_format}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _response_cache_get(key: str) -> str | None:
+    if os.getenv("GROQ_CACHE_DISABLE") == "1":
+        return None
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            return None
+        content, expires_at = entry
+        if expires_at < time.monotonic():
+            del _response_cache[key]
+            return None
+        _response_cache.move_to_end(key)
+        return content
+
+
+def _response_cache_put(key: str, content: str) -> None:
+    if os.getenv("GROQ_CACHE_DISABLE") == "1":
+        return
+    with _response_cache_lock:
+        _response_cache[key] = (content, time.monotonic() + _RESPONSE_CACHE_TTL_S)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+
 def generate_candidate_summary(
     resume: StructuredResume,
     job: StructuredJobDescription,
     total_score: float,
 ) -> dict[str, Any]:
-    def _canon(s: str) -> str:
-        return "".join(" ".join(str(s).strip().split()).casefold().split())
-
-    resume_skills = {_canon(s) for s in resume.skills}
-    resume_skills.discard("")
-    required = [(raw, _canon(raw)) for raw in job.required_skills]
-    required = [(raw, c) for raw, c in required if c]
+    resume_skills = frozenset(c for s in resume.skills if (c := _canon(s)))
+    required = [(raw, c) for raw in job.required_skills if (c := _canon(raw))]
 
     matched_required = [raw for raw, c in required if c in resume_skills]
     missing_required = [raw for raw, c in required if c not in resume_skills]
@@ -284,7 +499,8 @@ def generate_candidate_summary(
         strengths.append("No required education constraint.")
     else:
         req_ed = job.required_education.casefold()
-        ed_ok = any(req_ed in e.casefold() for e in resume.education)
+        resume_edu_cf = _cf_tuple(tuple(resume.education))
+        ed_ok = any(req_ed in e for e in resume_edu_cf)
         if ed_ok:
             strengths.append(f"Meets education requirement ({job.required_education}).")
         else:
@@ -293,7 +509,8 @@ def generate_candidate_summary(
     if job.domain is None:
         strengths.append("No domain constraint.")
     else:
-        dom_ok = any(job.domain.casefold() == d.casefold() for d in resume.domains)
+        resume_dom_cf = frozenset(_cf_tuple(tuple(resume.domains)))
+        dom_ok = job.domain.casefold() in resume_dom_cf
         if dom_ok:
             strengths.append(f"Domain match: {job.domain}.")
         else:
@@ -315,18 +532,10 @@ def generate_candidate_summary(
         else "Recommend rejection based on current evidence."
     )
 
-    schema = {
-        "type": "object",
-        "additionalProperties": False,
-        "properties": {"recommendation": {"type": "string"}},
-        "required": ["recommendation"],
-    }
-    system = (
-        "You write concise hiring recommendations.\n"
-        "Return a single JSON object only.\n"
-        "Do not add extra keys.\n"
-        f"JSON Schema:\n{json.dumps(schema, ensure_ascii=False)}\n"
-    )
+    if not _api_key_cached():
+        return {"strengths": strengths, "gaps": gaps, "recommendation": base_reco}
+
+    system = _SUMMARY_SYSTEM_PROMPT
     user = json.dumps(
         {
             "total_score_0_to_100": float(total_score),
@@ -335,31 +544,59 @@ def generate_candidate_summary(
             "fallback_recommendation": base_reco,
         },
         ensure_ascii=False,
+        sort_keys=True,
     )
 
-    for model in _get_groq_models():
+    def attempt(model: str) -> str | None:
         _logger.info("model_attempt model=%s target=%s", model, "summary_recommendation")
         try:
             content, latency_ms = _chat_completion(
                 messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
                 model=model,
-                timeout_s=18,
+                timeout_s=_SUMMARY_BUDGET_S,
             )
             parsed = _parse_json_object(content)
             reco = parsed.get("recommendation")
             if not isinstance(reco, str) or not reco.strip():
                 raise ValueError("recommendation schema mismatch")
-            _logger.info("model_success model=%s target=%s latency_ms=%s", model, "summary_recommendation", latency_ms)
-            return {"strengths": strengths, "gaps": gaps, "recommendation": reco.strip()}
         except ValueError as e:
             _logger.warning("model_failure model=%s target=%s detail=%s", model, "summary_recommendation", e)
-            continue
+            return None
+        _logger.info("model_success model=%s target=%s latency_ms=%s", model, "summary_recommendation", latency_ms)
+        return reco.strip()
+
+    # The deterministic recommendation is a fine answer, so race the first models under a
+    # hard budget instead of walking the whole list.
+    reco = _first_success(_get_groq_models()[:_get_hedge_k()], attempt, timeout_s=_SUMMARY_BUDGET_S)
+    if reco is not None:
+        return {"strengths": strengths, "gaps": gaps, "recommendation": reco}
 
     return {"strengths": strengths, "gaps": gaps, "recommendation": base_reco}
 
 
-def _system_prompt(schema: Mapping[str, Any], extraction_target: str) -> str:
-    schema_json = json.dumps(schema, ensure_ascii=False)
+@lru_cache(maxsize=8192)
+def _canon(s: str) -> str:
+    return _WS_RE.sub("", str(s)).casefold()
+
+
+@lru_cache(maxsize=2048)
+def _cf_tuple(t: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(s.casefold() for s in t)
+
+
+@lru_cache(maxsize=16)
+def _prompts_for(model_cls: type[BaseModel], extraction_target: str) -> tuple[str, str, str]:
+    """Render (system_prompt, json_retry_prompt, schema_json) once per schema and target."""
+
+    schema_json = json.dumps(model_cls.model_json_schema(), ensure_ascii=False)
+    return (
+        _system_prompt(schema_json=schema_json, extraction_target=extraction_target),
+        _json_retry_prompt(schema_json=schema_json, extraction_target=extraction_target),
+        schema_json,
+    )
+
+
+def _system_prompt(schema_json: str, extraction_target: str) -> str:
     return (
         "You are a strict information extraction engine for an AI hiring evaluation system.\n"
         f"Extract structured factual data for: {extraction_target}.\n"
@@ -373,8 +610,7 @@ def _system_prompt(schema: Mapping[str, Any], extraction_target: str) -> str:
     )
 
 
-def _json_retry_prompt(schema: Mapping[str, Any], extraction_target: str) -> str:
-    schema_json = json.dumps(schema, ensure_ascii=False)
+def _json_retry_prompt(schema_json: str, extraction_target: str) -> str:
     return (
         "You are a strict information extraction engine.\n"
         f"Extract structured factual data for: {extraction_target}.\n"
@@ -388,8 +624,7 @@ def _json_retry_prompt(schema: Mapping[str, Any], extraction_target: str) -> str
     )
 
 
-def _correction_prompt(schema: Mapping[str, Any], extraction_target: str, error: str) -> str:
-    schema_json = json.dumps(schema, ensure_ascii=False)
+def _correction_prompt(schema_json: str, extraction_target: str, error: str) -> str:
     return (
         "You are a strict JSON repair and extraction engine.\n"
         f"The previous output for {extraction_target} did not validate.\n"
@@ -409,9 +644,16 @@ def _parse_json_object(content: str) -> dict[str, Any]:
         raise ValueError("LLM output is not a string")
 
     text = content.strip()
+    # Fast path: JSON mode normally returns a bare object, so skip the fence/brace scan.
+    try:
+        parsed = _json_loads(text)
+    except json.JSONDecodeError:
+        parsed = None
+    if isinstance(parsed, dict):
+        return parsed
+
     if text.startswith("```"):
-        lines = [line for line in text.splitlines() if not line.strip().startswith("```")]
-        text = "\n".join(lines).strip()
+        text = _FENCE_RE.sub("", text).strip()
 
     start = text.find("{")
     end = text.rfind("}")
@@ -420,7 +662,7 @@ def _parse_json_object(content: str) -> dict[str, Any]:
 
     candidate = text[start : end + 1]
     try:
-        parsed = json.loads(candidate)
+        parsed = _json_loads(candidate)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON from LLM: {e}") from None
 
@@ -430,32 +672,178 @@ def _parse_json_object(content: str) -> dict[str, Any]:
     return parsed
 
 
-def _do_request_with_retry(req: urllib.request.Request, *, timeout_s: int) -> tuple[str, int]:
+def _json_loads(text: str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson is strict (no NaN/Infinity); let the stdlib parser decide.
+            pass
+    return json.loads(text)
+
+
+def _json_bytes(obj: Any) -> bytes:
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode("utf-8")
+
+
+def close_http_connections() -> None:
+    while True:
+        try:
+            conn = _idle_connections.get_nowait()
+        except queue.Empty:
+            return
+        conn.close()
+
+
+def _do_request_with_retry(data: bytes, headers: Mapping[str, str], *, timeout_s: int) -> tuple[str, int]:
+    """
+    Retry transient failures with capped exponential backoff and full jitter.
+
+    Jitter keeps concurrent workers from retrying in lockstep; a Retry-After header on a
+    429/503 raises the delay up to the backoff cap.
+    """
+
     transient_http = {429, 500, 502, 503, 504}
-    last_err: Exception | None = None
-    for attempt in range(2):
+    max_attempts, cap_s = _get_retry_settings()
+    for attempt in range(max_attempts):
+        last_attempt = attempt == max_attempts - 1
         try:
-            return _do_request(req, timeout_s=timeout_s)
+            return _do_request(data, headers, timeout_s=timeout_s)
         except urllib.error.HTTPError as e:
-            last_err = e
-            if e.code not in transient_http or attempt == 1:
+            if e.code not in transient_http or last_attempt:
                 raise
-            time.sleep(0.4 * (attempt + 1))
-            continue
+            delay = random.uniform(0, min(cap_s, 0.5 * (2**attempt)))
+            retry_after = _parse_retry_after(e.headers.get("Retry-After") if e.headers else None)
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, cap_s))
         except urllib.error.URLError as e:
-            last_err = e
-            if attempt == 1:
+            # A timeout may mean the completion ran (and was billed); don't send it again.
+            if last_attempt or isinstance(e.reason, TimeoutError):
                 raise
-            time.sleep(0.4 * (attempt + 1))
-            continue
-    if last_err:
-        raise last_err
+            delay = random.uniform(0, min(cap_s, 0.5 * (2**attempt)))
+        time.sleep(delay)
     raise ValueError("request failed")
 
 
-def _do_request(req: urllib.request.Request, *, timeout_s: int) -> tuple[str, int]:
+def _get_retry_settings() -> tuple[int, float]:
+    try:
+        max_attempts = int(os.getenv("GROQ_RETRY_MAX", "4"))
+    except ValueError:
+        max_attempts = 4
+    try:
+        cap_s = float(os.getenv("GROQ_RETRY_CAP_S", "8"))
+    except ValueError:
+        cap_s = 8.0
+    return max(1, max_attempts), max(0.0, cap_s)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(tz=timezone.utc)).total_seconds())
+
+
+def _do_request(data: bytes, headers: Mapping[str, str], *, timeout_s: int) -> tuple[str, int]:
+    """
+    POST to the Groq chat completions endpoint over a pooled keep-alive connection.
+
+    Failures are reported the way urllib reports them (HTTPError for non-2xx responses,
+    URLError for connection problems) so callers keep one error-handling path.
+    """
+
     start = time.perf_counter()
-    with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-        body = resp.read().decode("utf-8")
+    try:
+        conn = _idle_connections.get_nowait()
+        reused = True
+    except queue.Empty:
+        conn = _new_connection()
+        reused = False
+
+    while True:
+        responded = False
+        try:
+            if conn.sock is None:
+                # Connect under the short connect timeout, then switch the socket to the read timeout.
+                conn.timeout = _CONNECT_TIMEOUT_S
+                conn.connect()
+            conn.sock.settimeout(timeout_s)
+            conn.request("POST", _GROQ_PATH, body=data, headers=dict(headers))
+            resp = conn.getresponse()
+            responded = True
+            body = _read_capped(resp)
+            break
+        except ValueError:
+            # The rest of the oversized body is still on the wire; drop the connection.
+            conn.close()
+            raise
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            if reused and not responded and isinstance(e, _STALE_CONNECTION_ERRORS):
+                # The server dropped an idle keep-alive connection before answering; retry once
+                # on a fresh one. Anything else (notably a read timeout after the request went
+                # out) may already have been processed, so it is reported as is.
+                conn = _new_connection()
+                reused = False
+                continue
+            raise urllib.error.URLError(e) from None
+
+    if resp.will_close:
+        conn.close()
+    else:
+        try:
+            _idle_connections.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    if resp.status >= 400:
+        raise urllib.error.HTTPError(_GROQ_ENDPOINT, resp.status, resp.reason, resp.headers, io.BytesIO(body))
+
     latency_ms = int((time.perf_counter() - start) * 1000)
-    return body, latency_ms
+    charset = resp.headers.get_content_charset() or "utf-8"
+    try:
+        return body.decode(charset), latency_ms
+    except LookupError:
+        # Unknown charset label; the API speaks UTF-8.
+        return body.decode("utf-8"), latency_ms
+
+
+def _new_connection() -> http.client.HTTPSConnection:
+    """
+    Fresh connection to the Groq API, tunnelled through HTTPS_PROXY unless NO_PROXY exempts the host.
+
+    - Proxy settings are read the way urllib reads them (environment, then platform config).
+    - Credentials in the proxy URL are sent as Basic Proxy-Authorization on the CONNECT.
+    """
+
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(_GROQ_HOST):
+        return http.client.HTTPSConnection(_GROQ_HOST, timeout=_CONNECT_TIMEOUT_S)
+
+    parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    conn = http.client.HTTPSConnection(parts.hostname, parts.port or 80, timeout=_CONNECT_TIMEOUT_S)
+    tunnel_headers = {}
+    if parts.username is not None:
+        userinfo = f"{urllib.parse.unquote(parts.username)}:{urllib.parse.unquote(parts.password or '')}"
+        tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(userinfo.encode()).decode("ascii")
+    conn.set_tunnel(_GROQ_HOST, 443, headers=tunnel_headers)
+    return conn
+
+
+def _read_capped(resp: http.client.HTTPResponse) -> bytes:
+    buf = bytearray()
+    while chunk := resp.read(_RESPONSE_READ_CHUNK):
+        buf += chunk
+        if len(buf) > _MAX_RESPONSE_BYTES:
+            raise ValueError("response too large")
+    return bytes(buf)
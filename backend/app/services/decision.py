@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
 
 
 class DecisionOutcome(str, Enum):
@@ -11,7 +11,12 @@ class DecisionOutcome(str, Enum):
     REJECT = "REJECT"
 
 
-@dataclass(frozen=True)
+_AUTO = DecisionOutcome.AUTO_ADVANCE
+_MANUAL = DecisionOutcome.MANUAL_REVIEW
+_REJECT = DecisionOutcome.REJECT
+
+
+@dataclass(frozen=True, slots=True)
 class DecisionResult:
     decision_outcome: DecisionOutcome
     reason: str
@@ -19,7 +24,34 @@ class DecisionResult:
     decision_confidence_0_to_1: float
 
 
-def decide(total_score: float, rubric: Mapping[str, Any], *, confidence_score: float | None = None) -> DecisionResult:
+@dataclass(frozen=True, slots=True)
+class CompiledRubric:
+    auto_advance: float
+    manual_review: float
+    band: float
+
+
+def compile_rubric(rubric: Mapping[str, Any]) -> CompiledRubric:
+    """
+    Validate rubric thresholds once so repeated decisions skip re-parsing.
+
+    - Same rules and defaults as `decide`; raises ValueError if invalid.
+    """
+
+    thresholds = _extract_thresholds(rubric)
+    return CompiledRubric(
+        auto_advance=thresholds["auto_advance"],
+        manual_review=thresholds["manual_review"],
+        band=_extract_borderline_band(rubric),
+    )
+
+
+def decide(
+    total_score: float,
+    rubric: Mapping[str, Any] | CompiledRubric,
+    *,
+    confidence_score: float | None = None,
+) -> DecisionResult:
     """
     Deterministic decision engine based on threshold rules.
 
@@ -28,66 +60,68 @@ def decide(total_score: float, rubric: Mapping[str, Any], *, confidence_score: f
     """
 
     score = _validate_score(total_score)
-    thresholds = _extract_thresholds(rubric)
+    cr = rubric if isinstance(rubric, CompiledRubric) else compile_rubric(rubric)
 
-    auto_advance = thresholds["auto_advance"]
-    manual_review = thresholds["manual_review"]
-    band = _extract_borderline_band(rubric)
+    auto_advance = cr.auto_advance
+    manual_review = cr.manual_review
+    band = cr.band
 
     if score >= auto_advance:
-        return DecisionResult(
-            decision_outcome=DecisionOutcome.AUTO_ADVANCE,
-            reason=_reason_auto(score=score, auto_advance=auto_advance, manual_review=manual_review, band=band),
-            thresholds_used=thresholds,
-            decision_confidence_0_to_1=_decision_confidence(
-                decision=DecisionOutcome.AUTO_ADVANCE,
-                score=score,
-                auto_advance=auto_advance,
-                manual_review=manual_review,
-                confidence_score=confidence_score,
-            ),
-        )
-
-    if score >= manual_review:
-        return DecisionResult(
-            decision_outcome=DecisionOutcome.MANUAL_REVIEW,
-            reason=_reason_manual(score=score, auto_advance=auto_advance, manual_review=manual_review, band=band),
-            thresholds_used=thresholds,
-            decision_confidence_0_to_1=_decision_confidence(
-                decision=DecisionOutcome.MANUAL_REVIEW,
-                score=score,
-                auto_advance=auto_advance,
-                manual_review=manual_review,
-                confidence_score=confidence_score,
-            ),
-        )
-
-    if score >= manual_review - band:
-        return DecisionResult(
-            decision_outcome=DecisionOutcome.MANUAL_REVIEW,
-            reason=_reason_borderline(score=score, auto_advance=auto_advance, manual_review=manual_review, band=band),
-            thresholds_used=thresholds,
-            decision_confidence_0_to_1=_decision_confidence(
-                decision=DecisionOutcome.MANUAL_REVIEW,
-                score=score,
-                auto_advance=auto_advance,
-                manual_review=manual_review,
-                confidence_score=confidence_score,
-            ),
-        )
-
-    return DecisionResult(
-        decision_outcome=DecisionOutcome.REJECT,
-        reason=_reason_reject(score=score, auto_advance=auto_advance, manual_review=manual_review, band=band),
-        thresholds_used=thresholds,
-        decision_confidence_0_to_1=_decision_confidence(
-            decision=DecisionOutcome.REJECT,
-            score=score,
-            auto_advance=auto_advance,
-            manual_review=manual_review,
-            confidence_score=confidence_score,
-        ),
-    )
+        outcome = _AUTO
+        reason = _reason_auto(score=score, auto_advance=auto_advance, manual_review=manual_review, band=band)
+        margin = score - auto_advance
+    elif score >= manual_review:
+        outcome = _MANUAL
+        reason = _reason_manual(score=score, auto_advance=auto_advance, manual_review=manual_review, band=band)
+        margin = min(score - manual_review, auto_advance - score)
+    elif score >= manual_review - band:
+        outcome = _MANUAL
+        reason = _reason_borderline(score=score, auto_advance=auto_advance, manual_review=manual_review, band=band)
+        margin = min(score - manual_review, auto_advance - score)
+    else:
+        outcome = _REJECT
+        reason = _reason_reject(score=score, auto_advance=auto_advance, manual_review=manual_review, band=band)
+        margin = manual_review - score
+
+    conf = 0.5 + 0.5 * _clamp01(max(0.0, margin) / 10.0)
+    if confidence_score is not None:
+        conf = conf * 0.6 + _clamp01(float(confidence_score)) * 0.4
+
+    thresholds = {"auto_advance": auto_advance, "manual_review": manual_review}
+    return DecisionResult(outcome, reason, thresholds, _clamp01(conf))
+
+
+def decide_batch(
+    total_scores: Iterable[float], rubric: Mapping[str, Any] | CompiledRubric
+) -> tuple[list[DecisionOutcome], list[float]]:
+    """
+    Outcomes and confidences for many scores against one rubric.
+
+    - Thresholds are extracted and validated once for the whole batch.
+    - Reasons are not built; call `decide` for the candidates that need one.
+    """
+
+    cr = rubric if isinstance(rubric, CompiledRubric) else compile_rubric(rubric)
+    auto_advance = cr.auto_advance
+    manual_review = cr.manual_review
+    review_floor = manual_review - cr.band
+
+    outcomes: list[DecisionOutcome] = []
+    confidences: list[float] = []
+    for total_score in total_scores:
+        score = _validate_score(total_score)
+        if score >= auto_advance:
+            outcomes.append(_AUTO)
+            margin = score - auto_advance
+        elif score >= review_floor:
+            outcomes.append(_MANUAL)
+            margin = min(score - manual_review, auto_advance - score)
+        else:
+            outcomes.append(_REJECT)
+            margin = manual_review - score
+        confidences.append(0.5 + 0.5 * _clamp01(max(0.0, margin) / 10.0))
+
+    return outcomes, confidences
 
 
 def _extract_thresholds(rubric: Mapping[str, Any]) -> dict[str, float]:
@@ -155,32 +189,6 @@ def _reason_reject(*, score: float, auto_advance: float, manual_review: float, b
     return f"Reject: score {score:.2f} < manual_review {manual_review:.2f}"
 
 
-def _decision_confidence(
-    *,
-    decision: DecisionOutcome,
-    score: float,
-    auto_advance: float,
-    manual_review: float,
-    confidence_score: float | None,
-) -> float:
-    if decision == DecisionOutcome.AUTO_ADVANCE:
-        margin = score - auto_advance
-    elif decision == DecisionOutcome.REJECT:
-        margin = manual_review - score
-    else:
-        lower = score - manual_review
-        upper = auto_advance - score
-        margin = lower if lower < upper else upper
-
-    margin = 0.0 if margin < 0.0 else margin
-    base = 0.5 + 0.5 * _clamp01(margin / 10.0)
-
-    if confidence_score is None:
-        return _clamp01(base)
-
-    return _clamp01(base * 0.6 + _clamp01(float(confidence_score)) * 0.4)
-
-
 def _clamp01(x: float) -> float:
     return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
 
@@ -14,6 +14,18 @@ from app.services.scoring.engine import ScoreResult, score_candidate
 
 _logger = logging.getLogger(__name__)
 
+_SENIORITY_TERMS = ("senior", "principal", "staff", "lead", "architect", "manager", "head of")
+_LEADERSHIP_TERMS = ("led", "managed", "mentored", "ownership", "owned", "stakeholder", "roadmap", "strategy")
+# Indexed by seniority (bit 0) | leadership-for-a-senior-role (bit 1); boosts cap at 2 points.
+_BOOST_TABLE: tuple[tuple[float, tuple[str, ...]], ...] = (
+    (0.0, ()),
+    (1.0, ("seniority_signal",)),
+    (1.0, ("leadership_signal",)),
+    (2.0, ("seniority_signal", "leadership_signal")),
+)
+_SCAN_CHUNK_CHARS = 4096
+_SCAN_OVERLAP_CHARS = max(len(t) for t in _SENIORITY_TERMS + _LEADERSHIP_TERMS) - 1
+
 
 def run_evaluation(
     resume_structured: StructuredResume,
@@ -35,35 +47,34 @@ def run_evaluation(
         raise ValueError("rubric must be provided")
 
     # 2) Call scoring engine (pure deterministic function).
-    scoring_started = time.perf_counter()
+    started_ns = time.perf_counter_ns()
     score_result: ScoreResult = score_candidate(
         resume=resume_structured,
         job=job_structured,
         rubric=rubric,
     )
-    scoring_ms = int((time.perf_counter() - scoring_started) * 1000)
 
     confidence_score = _compute_confidence(score_result=score_result, context=context)
-    total_score = _apply_boosts(score_result=score_result, context=context)
+    total_score, breakdown_overrides = _apply_boosts(score_result=score_result, context=context)
+    scored_ns = time.perf_counter_ns()
 
     summary: dict[str, Any] | None = None
-    summary_started = time.perf_counter()
     try:
         summary = generate_candidate_summary(resume=resume_structured, job=job_structured, total_score=total_score)
     except Exception:
         summary = None
-    summary_ms = int((time.perf_counter() - summary_started) * 1000)
+    summarized_ns = time.perf_counter_ns()
 
-    decision_started = time.perf_counter()
     decision_result = decide(total_score=total_score, rubric=rubric, confidence_score=confidence_score)
-    decision_ms = int((time.perf_counter() - decision_started) * 1000)
-
-    _logger.info(
-        "evaluation_timing scoring_ms=%s summary_ms=%s decision_ms=%s",
-        scoring_ms,
-        summary_ms,
-        decision_ms,
-    )
+    decided_ns = time.perf_counter_ns()
+
+    if _logger.isEnabledFor(logging.INFO):
+        _logger.info(
+            "evaluation_timing scoring_ms=%s summary_ms=%s decision_ms=%s",
+            (scored_ns - started_ns) // 1_000_000,
+            (summarized_ns - scored_ns) // 1_000_000,
+            (decided_ns - summarized_ns) // 1_000_000,
+        )
 
     # 4) Trigger action based on decision (only side effect in this workflow).
     action_triggered = False
@@ -93,7 +104,9 @@ def run_evaluation(
     return {
         "evaluation_id": None,
         "total_score": total_score,
-        "score_breakdown": score_result.breakdown,
+        "score_breakdown": (
+            {**score_result.breakdown, **breakdown_overrides} if breakdown_overrides else score_result.breakdown
+        ),
         "confidence_score": confidence_score,
         "summary": summary,
         "decision": decision_result.decision_outcome.value,
@@ -129,43 +142,70 @@ def _compute_confidence(score_result: ScoreResult, context: Mapping[str, Any] |
     return _clamp01(skill_ratio * 0.6 + extraction_quality * 0.4)
 
 
-def _apply_boosts(score_result: ScoreResult, context: Mapping[str, Any] | None) -> float:
+def _apply_boosts(
+    score_result: ScoreResult, context: Mapping[str, Any] | None
+) -> tuple[float, dict[str, Any]]:
+    """
+    Seniority/leadership boosts on top of the engine score.
+
+    Returns (total, breakdown_overrides); score_result itself is never modified, so it can be
+    shared across workers.
+    """
+
     score = float(score_result.total_score)
     resume_text = (context or {}).get("resume_text")
     job_text = (context or {}).get("job_text")
     if not isinstance(resume_text, str) or not isinstance(job_text, str):
-        return score
-
-    rt = resume_text.casefold()
-    jt = job_text.casefold()
+        return score, {}
 
-    seniority_terms = ("senior", "principal", "staff", "lead", "architect", "manager", "head of")
-    leadership_terms = ("led", "managed", "mentored", "ownership", "owned", "stakeholder", "roadmap", "strategy")
+    job_senior = _contains_any(job_text, _SENIORITY_TERMS)
+    # Leadership only counts for senior roles, so only look for it then; one pass either way.
+    resume_senior, resume_leadership = _scan_resume(resume_text, want_leadership=job_senior)
 
-    resume_senior = any(t in rt for t in seniority_terms)
-    resume_leadership = any(t in rt for t in leadership_terms)
-    job_senior = any(t in jt for t in seniority_terms)
+    boost, signals = _BOOST_TABLE[resume_senior | (resume_leadership << 1)]
+    if not boost:
+        return score, {}
 
-    boost = 0.0
-    signals: list[str] = []
-    if resume_senior:
-        boost += 1.0
-        signals.append("seniority_signal")
-    if job_senior and resume_leadership:
-        boost += 1.0
-        signals.append("leadership_signal")
-
-    if boost <= 0:
-        return score
-
-    boost = 2.0 if boost > 2.0 else boost
     total = score + boost
     total = 0.0 if total < 0.0 else 100.0 if total > 100.0 else total
     total = round(total, 2)
 
-    score_result.breakdown["boosts"] = {"points": boost, "signals": signals}
-    score_result.breakdown["total_score_0_to_100"] = total
-    return total
+    return total, {"boosts": {"points": boost, "signals": list(signals)}, "total_score_0_to_100": total}
+
+
+def _contains_any(text: str, terms: tuple[str, ...]) -> bool:
+    """
+    Case-insensitive `any(t in text for t in terms)` that casefolds chunk by chunk.
+
+    - Stops at the first hit instead of casefolding the whole document up front.
+    - Chunks overlap by the longest term so matches across a boundary are not missed.
+    """
+
+    for start in range(0, len(text), _SCAN_CHUNK_CHARS):
+        chunk = text[max(0, start - _SCAN_OVERLAP_CHARS) : start + _SCAN_CHUNK_CHARS].casefold()
+        if any(t in chunk for t in terms):
+            return True
+    return False
+
+
+def _scan_resume(text: str, *, want_leadership: bool) -> tuple[bool, bool]:
+    """
+    (seniority hit, leadership hit) for a resume, casefolding each chunk once for both sets.
+
+    - Stops as soon as every wanted flag is set.
+    - Leadership is always False when not wanted.
+    """
+
+    senior = leadership = False
+    for start in range(0, len(text), _SCAN_CHUNK_CHARS):
+        chunk = text[max(0, start - _SCAN_OVERLAP_CHARS) : start + _SCAN_CHUNK_CHARS].casefold()
+        if not senior:
+            senior = any(t in chunk for t in _SENIORITY_TERMS)
+        if want_leadership and not leadership:
+            leadership = any(t in chunk for t in _LEADERSHIP_TERMS)
+        if senior and (leadership or not want_leadership):
+            break
+    return senior, leadership
 
 
 def _clamp01(x: float) -> float:
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Any, Mapping
+from functools import lru_cache
+from typing import Any, Mapping, Sequence
 
 from app.api.v1.schemas.job import StructuredJobDescription
 from app.api.v1.schemas.resume import StructuredResume
 
 
-@dataclass(frozen=True)
+_DIMENSIONS = ("required_skills", "experience", "domain_match", "projects", "education")
+
+
+@dataclass(frozen=True, slots=True)
 class ScoreResult:
     total_score: float
     breakdown: dict[str, Any]
@@ -26,11 +31,49 @@ def score_candidate(
     - Output is a 0–100 score with a per-dimension breakdown.
     """
 
+    return _score_prepared(resume, _prepare_job(job, rubric))
+
+
+def score_candidates_batch(
+    resumes: Sequence[StructuredResume],
+    job: StructuredJobDescription,
+    rubric: Mapping[str, Any],
+) -> list[ScoreResult]:
+    """
+    Score many resumes against one job; same results as calling `score_candidate` per resume.
+
+    - Rubric weights and job-side canonicalization (required skills, domain, education) run once.
+    """
+
+    prepared = _prepare_job(job, rubric)
+    return [_score_prepared(resume, prepared) for resume in resumes]
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedJob:
+    weights: dict[str, float]
+    required_items: tuple[tuple[str, str], ...]
+    minimum_years_experience: float
+    domain_norm: str
+    education_norm: str
+
+
+def _prepare_job(job: StructuredJobDescription, rubric: Mapping[str, Any]) -> _PreparedJob:
     # Rubric validation:
     # - All weights must be >= 0
     # - Sum of weights must be > 0
     # - Weights are normalized to sum to 1.0 for stable, predictable scoring
-    weights = _extract_weights(rubric)
+    return _PreparedJob(
+        weights=_extract_weights(rubric),
+        required_items=tuple((raw, canon) for raw in job.required_skills if (canon := _canon_skill(raw))),
+        minimum_years_experience=float(job.minimum_years_experience),
+        domain_norm=_norm_token(job.domain) if job.domain is not None else "",
+        education_norm=_norm_token(job.required_education) if job.required_education is not None else "",
+    )
+
+
+def _score_prepared(resume: StructuredResume, job: _PreparedJob) -> ScoreResult:
+    weights = job.weights
 
     # 1) Required Skills:
     # - Exact token match (case-insensitive)
@@ -38,7 +81,7 @@ def score_candidate(
     # - if no required skills -> 1.0
     required_skills_coverage = _required_skills_coverage(
         resume_skills=resume.skills,
-        required_skills=job.required_skills,
+        required_items=job.required_items,
     )
     required_skills_score = required_skills_coverage["ratio_0_to_1"]
 
@@ -48,7 +91,7 @@ def score_candidate(
     # - if minimum == 0 -> 1.0
     experience_score = _score_experience(
         total_years_experience=float(resume.total_years_experience),
-        minimum_years_experience=float(job.minimum_years_experience),
+        minimum_years_experience=job.minimum_years_experience,
     )
 
     # 3) Domain Match:
@@ -56,7 +99,7 @@ def score_candidate(
     # - if job.domain is None -> 1.0
     domain_match_score = _score_domain_match(
         resume_domains=resume.domains,
-        job_domain=job.domain,
+        job_domain_norm=job.domain_norm,
     )
 
     # 4) Projects:
@@ -69,35 +112,41 @@ def score_candidate(
     # - else case-insensitive substring match against resume.education entries
     education_score = _score_education(
         resume_education=resume.education,
-        required_education=job.required_education,
+        required_education_norm=job.education_norm,
     )
 
-    dimension_scores: dict[str, float] = {}
-    dimension_scores["required_skills"] = required_skills_score
-    dimension_scores["experience"] = experience_score
-    dimension_scores["domain_match"] = domain_match_score
-    dimension_scores["projects"] = projects_score
-    dimension_scores["education"] = education_score
+    dimension_scores = (
+        ("required_skills", required_skills_score),
+        ("experience", experience_score),
+        ("domain_match", domain_match_score),
+        ("projects", projects_score),
+        ("education", education_score),
+    )
 
     # Final score:
     # total_score = sum(weight * dimension_score) * 100
     # Rounded to 2 decimals to ensure consistent outputs.
     weighted_sum_0_to_1 = 0.0
-    breakdown: dict[str, Any] = {"dimensions": {}, "weights": weights.copy()}
-    breakdown["required_skills_coverage"] = required_skills_coverage.copy()
-
-    for dimension in ("required_skills", "experience", "domain_match", "projects", "education"):
-        score_0_to_1 = _clamp01(dimension_scores.get(dimension, 0.0))
-        w = weights.get(dimension, 0.0)
+    dimensions: dict[str, Any] = {}
+    for dimension, score in dimension_scores:
+        score_0_to_1 = _clamp01(score)
+        w = weights[dimension]
         contribution_0_to_1 = w * score_0_to_1
         weighted_sum_0_to_1 += contribution_0_to_1
 
-        breakdown["dimensions"][dimension] = {
+        dimensions[dimension] = {
             "score_0_to_1": score_0_to_1,
             "weight_0_to_1": w,
             "contribution_0_to_100": contribution_0_to_1 * 100.0,
         }
 
+    # The prepared weights are shared across a batch, so each result gets its own dict.
+    breakdown: dict[str, Any] = {
+        "dimensions": dimensions,
+        "weights": dict(weights),
+        "required_skills_coverage": required_skills_coverage,
+    }
+
     total_score = round(_clamp(weighted_sum_0_to_1 * 100.0, 0.0, 100.0), 2)
     breakdown["total_score_0_to_100"] = total_score
 
@@ -117,70 +166,59 @@ def _extract_weights(rubric: Mapping[str, Any]) -> dict[str, float]:
     if not isinstance(raw, Mapping):
         raise ValueError("rubric weights must be a mapping")
 
-    expected = ["required_skills", "experience", "domain_match", "projects", "education"]
-    weights: dict[str, float] = {}
+    values = tuple(raw.get(key, 0.0) for key in _DIMENSIONS)
+    try:
+        normalized = _normalized_weights(values)
+    except TypeError:
+        # Unhashable weight value: validate uncached so the usual ValueError is raised.
+        normalized = _normalized_weights.__wrapped__(values)
+
+    return dict(zip(_DIMENSIONS, normalized))
+
+
+@lru_cache(maxsize=256)
+def _normalized_weights(values: tuple[Any, ...]) -> tuple[float, ...]:
+    """Validate raw weights (in _DIMENSIONS order) and normalize them; cached per rubric shape."""
+
+    weights: list[float] = []
 
     total = 0.0
-    for key in expected:
-        value = raw.get(key, 0.0)
+    for key, value in zip(_DIMENSIONS, values):
         try:
             w = float(value)
         except (TypeError, ValueError):
             raise ValueError(f"rubric weight for '{key}' must be a number") from None
         if w < 0:
             raise ValueError(f"rubric weight for '{key}' must be >= 0")
-        weights[key] = w
+        weights.append(w)
         total += w
 
     if total <= 0:
         raise ValueError("rubric weights must sum to a positive number")
 
-    for key in expected:
-        weights[key] = weights[key] / total
-
-    return weights
+    return tuple(w / total for w in weights)
 
 
-def _score_required_skills(resume_skills: list[str], required_skills: list[str]) -> float:
-    """
-    Required Skills = percentage of required skills matched.
-
-    Matching is case-insensitive and based on exact normalized tokens.
-    """
-
-    if len(required_skills) == 0:
-        return 1.0
-
-    # Exact token match (case-insensitive) after normalization:
-    # - collapse whitespace
-    # - casefold for consistent case-insensitive matching
-    resume_set = _normalized_set(resume_skills)
-    required_set = _normalized_set(required_skills)
-
-    if len(required_set) == 0:
-        return 1.0
-
-    matched = len(resume_set.intersection(required_set))
-    return _clamp01(matched / len(required_set))
-
-
-def _required_skills_coverage(resume_skills: list[str], required_skills: list[str]) -> dict[str, Any]:
-    required_items: list[tuple[str, str]] = []
-    for raw in required_skills:
-        canon = _canon_skill(raw)
-        if canon:
-            required_items.append((raw, canon))
+def _required_skills_coverage(
+    resume_skills: list[str],
+    required_items: tuple[tuple[str, str], ...],
+) -> dict[str, Any]:
+    """required_items are (raw, canonical) pairs for the job's required skills, blanks dropped."""
 
     if len(required_items) == 0:
         return {"matched": 0, "total": 0, "ratio_0_to_1": 1.0, "matched_required": [], "missing_required": []}
 
-    resume_canon_set = {_canon_skill(s) for s in resume_skills}
-    resume_canon_set.discard("")
+    resume_canon_set = _canon_skills_frozen(tuple(resume_skills))
+
+    # Exact hits are one set intersection; only the leftovers need the substring fallback.
+    required_canon_set = {req for _, req in required_items}
+    hits = required_canon_set & resume_canon_set
+    hits.update(req for req in required_canon_set - hits if _skill_in_set(req, resume_canon_set))
 
     matched_required: list[str] = []
     missing_required: list[str] = []
     for raw, req in required_items:
-        if _skill_in_set(req, resume_canon_set):
+        if req in hits:
             matched_required.append(raw)
         else:
             missing_required.append(raw)
@@ -212,61 +250,49 @@ def _score_experience(total_years_experience: float, minimum_years_experience: f
     return _clamp01(total_years_experience / minimum_years_experience)
 
 
-def _score_domain_match(resume_domains: list[str], job_domain: str | None) -> float:
+def _score_domain_match(resume_domains: list[str], job_domain_norm: str) -> float:
     """
-    Domain Match:
-      - If job.domain is None -> full score (no domain constraint)
+    Domain Match (job_domain_norm is the _norm_token'd job.domain, "" if None):
+      - If job.domain is None or blank -> full score (no domain constraint)
       - If job.domain appears in resume.domains -> full score
       - Else 0
     """
 
-    if job_domain is None:
-        return 1.0
-
-    jd = _norm_token(job_domain)
-    if not jd:
+    if not job_domain_norm:
         return 1.0
 
-    resume_set = _normalized_set(resume_domains)
-    return 1.0 if jd in resume_set else 0.0
+    resume_set = _norm_set_frozen(tuple(resume_domains))
+    return 1.0 if job_domain_norm in resume_set else 0.0
 
 
-def _score_education(resume_education: list[str], required_education: str | None) -> float:
+def _score_education(resume_education: list[str], required_education_norm: str) -> float:
     """
-    Education:
-      - If required_education is None -> full score
+    Education (required_education_norm is the _norm_token'd requirement, "" if None):
+      - If required_education is None or blank -> full score
       - Else if required_education appears in any education entry -> full score
       - Else 0
     """
 
-    if required_education is None:
-        return 1.0
-
-    req = _norm_token(required_education)
+    req = required_education_norm
     if not req:
         return 1.0
 
-    # Case-insensitive substring match against each education entry.
-    req_cf = req.casefold()
-    for entry in resume_education:
-        entry_norm = _norm_token(entry)
-        if entry_norm and req_cf in entry_norm.casefold():
-            return 1.0
-
-    return 0.0
+    # Case-insensitive substring match against each education entry (_norm_token casefolds).
+    return 1.0 if any(req in entry for entry in _norm_tuple(tuple(resume_education))) else 0.0
 
 
 def _norm_token(value: str) -> str:
     return " ".join(value.strip().split()).casefold()
 
 
-def _normalized_set(values: list[str]) -> set[str]:
-    out: set[str] = set()
-    for v in values:
-        n = _norm_token(v)
-        if n:
-            out.add(n)
-    return out
+@lru_cache(maxsize=1024)
+def _norm_tuple(values: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(n for v in values if (n := _norm_token(v)))
+
+
+@lru_cache(maxsize=1024)
+def _norm_set_frozen(values: tuple[str, ...]) -> frozenset[str]:
+    return frozenset(n for v in values if (n := _norm_token(v)))
 
 
 _SKILL_SYNONYMS: dict[str, str] = {
@@ -299,34 +325,63 @@ _SKILL_SYNONYMS: dict[str, str] = {
     "golang": "go",
     "go": "go",
 }
+# Bound once: saves the attribute lookup on every canonicalization.
+_synonym = _SKILL_SYNONYMS.get
+
+
+_SEP_TO_SPACE = str.maketrans({"/": " ", "-": " ", "_": " "})
+_STRIP_SPACE = str.maketrans("", "", " \t\n\r")
 
 
 def _canon_skill(value: str) -> str:
-    s = _norm_token(value)
+    s = " ".join(value.casefold().translate(_SEP_TO_SPACE).split())
     if not s:
         return ""
-    s = s.replace("/", " ").replace("-", " ").replace("_", " ")
-    s = " ".join(s.split())
-    s = _SKILL_SYNONYMS.get(s, s)
-    s = s.replace(" ", "")
-    return _SKILL_SYNONYMS.get(s, s)
+    s = _synonym(s, s)
+    s = s.translate(_STRIP_SPACE)
+    # Skill names are a small, heavily repeated vocabulary; interning shares one object per
+    # name across evaluations. Do not intern free-form text (domains, education, raw resumes).
+    return sys.intern(_synonym(s, s))
 
 
-def _skill_in_set(required: str, resume_set: set[str]) -> bool:
+@lru_cache(maxsize=1024)
+def _canon_skills_frozen(skills: tuple[str, ...]) -> frozenset[str]:
+    """Canonical skill set for a resume; cached so ranking many jobs against one resume reuses it."""
+
+    return frozenset(c for s in skills if (c := _canon_skill(s)))
+
+
+def _skill_in_set(required: str, resume_set: frozenset[str]) -> bool:
     if required in resume_set:
         return True
 
     if len(required) < 4:
         return False
 
-    for r in resume_set:
-        if not r:
-            continue
-        if required in r or r in required:
+    if "\x00" in required:
+        # The joined index uses "\x00" as its separator; take the pairwise scan instead.
+        return any(required in r or r in required for r in resume_set)
+
+    haystack, by_length = _substring_index(resume_set)
+    # Some resume skill contains `required`: one C-level search over the joined skills.
+    if required in haystack:
+        return True
+    # `required` contains some resume skill: only skills no longer than it can match.
+    n = len(required)
+    for r in by_length:
+        if len(r) > n:
+            break
+        if r in required:
             return True
     return False
 
 
+@lru_cache(maxsize=1024)
+def _substring_index(resume_set: frozenset[str]) -> tuple[str, tuple[str, ...]]:
+    # Callers never search for a needle containing "\x00", so a hit cannot straddle two entries.
+    return "\x00".join(resume_set), tuple(sorted(resume_set, key=len))
+
+
 def _clamp01(x: float) -> float:
     return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
 
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import os
+import unittest
+
+from app.api.v1.schemas.job import StructuredJobDescription
+from app.api.v1.schemas.resume import StructuredResume
+from app.services.ai.extractor import _reset_api_key_cache
+from app.services.decision import DecisionOutcome
+from app.services.orchestrator import run_evaluation
+from app.services.scoring.engine import score_candidate
+
+_RUBRIC = {"weights": {"required_skills": 1.0}}
+
+
+def _resume() -> StructuredResume:
+    return StructuredResume.model_construct(
+        full_name="Jane Doe",
+        skills=["Python"],
+        education=[],
+        domains=[],
+        projects=[],
+        total_years_experience=0,
+    )
+
+
+def _job() -> StructuredJobDescription:
+    return StructuredJobDescription.model_construct(
+        required_skills=["Python", "React"],
+        minimum_years_experience=0,
+        required_education=None,
+        domain=None,
+    )
+
+
+class FreeTextSkillsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # Keep the summary on its deterministic fallback.
+        self._saved_key = os.environ.pop("GROQ_API_KEY", None)
+        _reset_api_key_cache()
+
+    def tearDown(self) -> None:
+        if self._saved_key is not None:
+            os.environ["GROQ_API_KEY"] = self._saved_key
+        _reset_api_key_cache()
+
+    def test_resume_text_does_not_change_required_skill_coverage(self) -> None:
+        context = {"resume_text": "I react calmly under pressure.", "job_text": "Backend role."}
+
+        result = run_evaluation(_resume(), _job(), _RUBRIC, context=context)
+
+        self.assertEqual(score_candidate(_resume(), _job(), _RUBRIC).total_score, 50.0)
+        self.assertEqual(result["total_score"], 50.0)
+        self.assertEqual(result["score_breakdown"]["required_skills_coverage"]["missing_required"], ["React"])
+        self.assertNotEqual(result["decision"], DecisionOutcome.AUTO_ADVANCE.value)
+
+
+if __name__ == "__main__":
+    unittest.main()